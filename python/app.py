@@ -4,11 +4,13 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import random, time
-from typing import Dict
+from fastapi.responses import ORJSONResponse
+from collections import deque
+import numpy as np
+import time
+from typing import Dict, List
 
-app = FastAPI(title="Bridge Health Monitoring API")
+app = FastAPI(title="Bridge Health Monitoring API", default_response_class=ORJSONResponse)
 
 # Allow all origins (for dashboard frontend)
 app.add_middleware(
@@ -23,43 +25,87 @@ app.add_middleware(
 # 📘 Synthetic Health Data Generator
 # ============================================================
 
-def generate_synthetic_data() -> Dict:
-    condition_labels = ["NORMAL", "MINOR_STRESS", "MODERATE_STRESS", "CRITICAL_STRESS"]
-    colors = {
-        "NORMAL": "#00ff88",
-        "MINOR_STRESS": "#ffff00",
-        "MODERATE_STRESS": "#ff9900",
-        "CRITICAL_STRESS": "#ff4444",
-    }
-    descriptions = {
-        "NORMAL": "Structure stable, minimal vibration.",
-        "MINOR_STRESS": "Minor stress detected under normal traffic load.",
-        "MODERATE_STRESS": "Moderate stress detected, vibration increasing.",
-        "CRITICAL_STRESS": "Critical stress! High vibration and risk detected.",
-    }
-    risk_levels = {
-        "NORMAL": "Low",
-        "MINOR_STRESS": "Medium",
-        "MODERATE_STRESS": "Medium-High",
-        "CRITICAL_STRESS": "High",
-    }
-
-    condition = random.choice(condition_labels)
-    confidence = round(random.uniform(0.7, 0.99), 3)
-    degradation = round(random.uniform(60, 95), 2)
-    forecast = round(degradation + random.uniform(-5, 5), 2)
-
-    return {
-        "timestamp": int(time.time() * 10000),
-        "degradation_score": degradation,
-        "forecast_score_next_30d": forecast,
-        "structural_condition": condition_labels.index(condition),
+condition_labels = ["NORMAL", "MINOR_STRESS", "MODERATE_STRESS", "CRITICAL_STRESS"]
+colors = {
+    "NORMAL": "#00ff88",
+    "MINOR_STRESS": "#ffff00",
+    "MODERATE_STRESS": "#ff9900",
+    "CRITICAL_STRESS": "#ff4444",
+}
+descriptions = {
+    "NORMAL": "Structure stable, minimal vibration.",
+    "MINOR_STRESS": "Minor stress detected under normal traffic load.",
+    "MODERATE_STRESS": "Moderate stress detected, vibration increasing.",
+    "CRITICAL_STRESS": "Critical stress! High vibration and risk detected.",
+}
+risk_levels = {
+    "NORMAL": "Low",
+    "MINOR_STRESS": "Medium",
+    "MODERATE_STRESS": "Medium-High",
+    "CRITICAL_STRESS": "High",
+}
+
+# Static response fields per condition, built once and indexed by condition id
+_CONDITION_PAYLOAD = [
+    {
+        "structural_condition": index,
         "condition_label": condition,
-        "confidence": confidence,
         "risk_level": risk_levels[condition],
         "description": descriptions[condition],
         "color": colors[condition],
     }
+    for index, condition in enumerate(condition_labels)
+]
+
+# Readings are generated BATCH_SIZE at a time and handed out one per /predict call
+BATCH_SIZE = 64
+_prediction_buffer = deque()
+
+# One shared generator instead of the legacy global RandomState
+rng = np.random.default_rng()
+
+# Bounds of the uniform draws, one row each: confidence, degradation, forecast offset
+_DRAW_LOW = np.array([[0.7], [60.0], [-5.0]])
+_DRAW_HIGH = np.array([[0.99], [95.0], [5.0]])
+
+def timestamp_ms() -> int:
+    """Current Unix time in milliseconds, using integer arithmetic only"""
+    return time.time_ns() // 1_000_000
+
+def generate_synthetic_batch(n: int) -> List[Dict]:
+    """Generate n synthetic predictions in one vectorized pass"""
+    conditions = rng.integers(0, len(condition_labels), n)
+    draws = rng.uniform(_DRAW_LOW, _DRAW_HIGH, (3, n))
+    confidences, degradations, forecasts = draws
+    np.round(confidences, 3, out=confidences)
+    np.round(degradations, 2, out=degradations)
+    forecasts += degradations
+    np.round(forecasts, 2, out=forecasts)
+    timestamp = timestamp_ms()
+
+    batch = []
+    for index, confidence, degradation, forecast in zip(
+        conditions.tolist(), confidences.tolist(), degradations.tolist(), forecasts.tolist()
+    ):
+        batch.append({
+            **_CONDITION_PAYLOAD[index],
+            "timestamp": timestamp,
+            "degradation_score": degradation,
+            "forecast_score_next_30d": forecast,
+            "confidence": confidence,
+        })
+    return batch
+
+def generate_synthetic_data() -> Dict:
+    """Return the next buffered synthetic prediction, refilling in batches"""
+    try:
+        data = _prediction_buffer.popleft()
+    except IndexError:
+        batch = generate_synthetic_batch(BATCH_SIZE)
+        data = batch.pop()
+        _prediction_buffer.extend(batch)
+    data["timestamp"] = timestamp_ms()
+    return data
 
 # ============================================================
 # 🧠 API Endpoints